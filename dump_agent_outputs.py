@@ -10,45 +10,33 @@ import json
 from pathlib import Path
 from datetime import datetime
 from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _format_section(name: str, data: dict) -> str:
     """Format a section as readable text."""
     lines = [f"\n{'='*70}", f"  {name}", f"{'='*70}\n"]
-    lines.append(json.dumps(data, indent=2, default=str))
+    if orjson is not None:
+        lines.append(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str,
+        ).decode())
+    else:
+        lines.append(json.dumps(data, indent=2, default=str))
     return "\n".join(lines)
 
 
-def main():
-    business_type = "electrician"
-    location = "providence, ri"
-    output_path = Path(__file__).parent / "agent_outputs_debug.txt"
-
-    lines = [
-        "# Agent Raw Outputs Debug",
-        f"# Generated: {datetime.now().isoformat()}",
-        f"# Query: {business_type} in {location}",
-        "#",
-        "# MAPPING TO FINAL REPORT:",
-        "#   Competitor Overview  <- local_intel.competitors",
-        "#   Customer Voice      <- yelp_intel.insights (pain_points, praise_points)",
-        "#   Seasonal Timing     <- trends_intel.seasonal_insights, keyword_data",
-        "#   Ad Hooks/Headlines  <- local_intel + yelp_intel ad_suggestions",
-        "#   Trust Signals       <- local_intel.trust_signals_to_use",
-        "#",
-        "# ISSUE: pain_points & praise_points are keyword matches (single words).",
-        "#   They come from PAIN_KEYWORDS/PRAISE_KEYWORDS in yelp_intel/agent.py",
-        "#",
-    ]
-
-    # -------------------------------------------------------------------------
-    # LOCAL INTEL
-    # -------------------------------------------------------------------------
+def _local_intel_section(business_type: str, location: str) -> str:
+    """Run Local Intel and format its raw output."""
     try:
         from local_intel import LocalIntelAgent
         agent = LocalIntelAgent()
@@ -87,13 +75,13 @@ def main():
             "tagline_suggestions": report.tagline_suggestions[:5],
             "trust_signals_to_use": report.trust_signals_to_use[:8],
         }
-        lines.append(_format_section("1. LOCAL INTEL (local_intel)", d))
+        return _format_section("1. LOCAL INTEL (local_intel)", d)
     except Exception as e:
-        lines.append(_format_section("1. LOCAL INTEL (local_intel)", {"error": str(e), "traceback": type(e).__name__}))
+        return _format_section("1. LOCAL INTEL (local_intel)", {"error": str(e), "traceback": type(e).__name__})
 
-    # -------------------------------------------------------------------------
-    # YELP INTEL
-    # -------------------------------------------------------------------------
+
+def _yelp_intel_section(business_type: str, location: str) -> str:
+    """Run Yelp Intel and format its raw output."""
     try:
         from yelp_intel import YelpIntelAgent
         agent = YelpIntelAgent()
@@ -127,13 +115,13 @@ def main():
                 "trust_signals": analysis.ad_suggestions.trust_signals,
             },
         }
-        lines.append(_format_section("2. YELP INTEL (yelp_intel)", d))
+        return _format_section("2. YELP INTEL (yelp_intel)", d)
     except Exception as e:
-        lines.append(_format_section("2. YELP INTEL (yelp_intel)", {"error": str(e)}))
+        return _format_section("2. YELP INTEL (yelp_intel)", {"error": str(e)})
 
-    # -------------------------------------------------------------------------
-    # TRENDS INTEL
-    # -------------------------------------------------------------------------
+
+def _trends_intel_section(business_type: str, location: str) -> str:
+    """Run Trends Intel and format its raw output."""
     try:
         from trends_intel import TrendsIntelAgent
         agent = TrendsIntelAgent()
@@ -168,9 +156,40 @@ def main():
             "related_queries": analysis.related_queries[:10],
             "rising_queries": analysis.rising_queries[:10],
         }
-        lines.append(_format_section("3. TRENDS INTEL (trends_intel)", d))
+        return _format_section("3. TRENDS INTEL (trends_intel)", d)
     except Exception as e:
-        lines.append(_format_section("3. TRENDS INTEL (trends_intel)", {"error": str(e)}))
+        return _format_section("3. TRENDS INTEL (trends_intel)", {"error": str(e)})
+
+
+def main():
+    business_type = "electrician"
+    location = "providence, ri"
+    output_path = Path(__file__).parent / "agent_outputs_debug.txt"
+
+    lines = [
+        "# Agent Raw Outputs Debug",
+        f"# Generated: {datetime.now().isoformat()}",
+        f"# Query: {business_type} in {location}",
+        "#",
+        "# MAPPING TO FINAL REPORT:",
+        "#   Competitor Overview  <- local_intel.competitors",
+        "#   Customer Voice      <- yelp_intel.insights (pain_points, praise_points)",
+        "#   Seasonal Timing     <- trends_intel.seasonal_insights, keyword_data",
+        "#   Ad Hooks/Headlines  <- local_intel + yelp_intel ad_suggestions",
+        "#   Trust Signals       <- local_intel.trust_signals_to_use",
+        "#",
+        "# ISSUE: pain_points & praise_points are keyword matches (single words).",
+        "#   They come from PAIN_KEYWORDS/PRAISE_KEYWORDS in yelp_intel/agent.py",
+        "#",
+    ]
+
+    # -------------------------------------------------------------------------
+    # RUN AGENTS (independent network crawls, so run them concurrently)
+    # -------------------------------------------------------------------------
+    sections = [_local_intel_section, _yelp_intel_section, _trends_intel_section]
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        futures = [executor.submit(fn, business_type, location) for fn in sections]
+        lines.extend(f.result() for f in futures)
 
     # -------------------------------------------------------------------------
     # WRITE
@@ -3,6 +3,8 @@ Ad differentiation generator.
 Creates advertising angles and copy based on competitive analysis.
 """
 
+import functools
+import re
 from typing import List, Dict, Optional
 from .models import (
     Competitor, WebsiteData, MarketAnalysis,
@@ -85,6 +87,100 @@ class AdDifferentiationGenerator:
         ],
     }
     
+    # Generic industry headlines
+    INDUSTRY_HEADLINES = {
+        "plumber": (
+            "Your Local Plumbing Experts",
+            "Fast. Reliable. Affordable.",
+            "Plumbing Problems? Solved.",
+        ),
+        "electrician": (
+            "Power You Can Trust",
+            "Safe. Reliable. Professional.",
+            "Electrical Done Right",
+        ),
+        "restaurant": (
+            "Taste the Difference",
+            "Where Flavor Meets Freshness",
+            "Your New Favorite Spot",
+        ),
+        "contractor": (
+            "Building Your Vision",
+            "Quality Craftsmanship. Fair Prices.",
+            "Your Home, Transformed",
+        ),
+        "default": (
+            "Service You Can Trust",
+            "Quality. Value. Results.",
+            "The Local Choice",
+        ),
+    }
+    
+    # Supporting points, proof and best platform per hook type
+    SUPPORTING_POINTS = {
+        "emergency": ("Fast response time", "Available 24/7", "No extra fees for emergencies"),
+        "trust": ("Licensed and insured", "Background-checked", "Thousands of happy customers"),
+        "pricing": ("Free estimates", "No hidden fees", "Price match guarantee"),
+        "quality": ("Trained professionals", "Premium materials", "Satisfaction guaranteed"),
+        "speed": ("Same-day availability", "On-time guarantee", "Efficient service"),
+        "local": ("Community involvement", "Local knowledge", "Supporting local economy"),
+        "default": ("Quality service", "Professional team"),
+    }
+    
+    PROOF_NEEDED = {
+        "emergency": "Show response time statistics or customer testimonial about emergency service",
+        "trust": "Display review count, ratings, certifications prominently",
+        "pricing": "Show sample pricing or comparison with competitors",
+        "quality": "Before/after photos, warranty information",
+        "speed": "Same-day booking calendar, response time data",
+        "local": "Team photos, community involvement images",
+    }
+    
+    BEST_PLATFORMS = {
+        "emergency": "Google Ads (search intent)",
+        "trust": "Facebook/Instagram (social proof)",
+        "pricing": "Google Ads, Website",
+        "quality": "Instagram, Website portfolio",
+        "speed": "Google Ads, Google Business Profile",
+        "local": "Facebook, Nextdoor, Local print",
+    }
+    
+    # Location-independent taglines (generate_taglines prepends a local one)
+    TAGLINES = (
+        "Quality you can trust, service you deserve",
+        "Your satisfaction, guaranteed",
+        "Locally owned, community trusted",
+        "Excellence in every job",
+        "Where quality meets reliability",
+        "Professional service, personal touch",
+        "Done right. Done on time.",
+    )
+    
+    # Standard trust signals, prioritized when competitors don't use them
+    STANDARD_TRUST_SIGNALS = (
+        "Licensed & Insured",
+        "Free Estimates",
+        "Satisfaction Guaranteed",
+        "24/7 Emergency Service",
+        "Same-Day Service Available",
+        "Background-Checked Technicians",
+        "Upfront Pricing",
+        "Locally Owned & Operated",
+        "Family-Owned Since [Year]",
+        "[X]+ Years Experience",
+        "[X]+ 5-Star Reviews",
+        "BBB Accredited",
+    )
+    
+    # Trust signals worth emphasizing when competitors rarely mention them
+    DESIRED_TRUST_SIGNALS = (
+        "Background Checked",
+        "Same Day Service",
+        "Upfront Pricing",
+        "Satisfaction Guarantee",
+        "On Time Guarantee",
+    )
+    
     def __init__(self, business_type: str = "default"):
         self.business_type = business_type.lower()
     
@@ -96,12 +192,18 @@ class AdDifferentiationGenerator:
         """Generate competitive insights from market analysis."""
         insights = []
         
+        # Lowercase each competitor's services once (one blob per website)
+        # rather than for every gap checked
+        service_blobs = [
+            "\n".join(s.lower() for s in w.services) for w in websites
+        ]
+        
         # Service gap insights
         for gap in market_analysis.service_gaps[:5]:
             insight = CompetitiveInsight(
                 insight_type=InsightType.SERVICE_GAP,
                 title=f"Service Opportunity: {gap}",
-                description=f"Only {self._count_offering(gap, websites)} of {len(websites)} competitors prominently offer {gap}.",
+                description=f"Only {self._count_offering(gap, service_blobs)} of {len(websites)} competitors prominently offer {gap}.",
                 evidence=[f"{gap} mentioned by few competitors"],
                 suggested_copy=[
                     f"Need {gap.lower()}? We're the experts.",
@@ -216,119 +318,70 @@ class AdDifferentiationGenerator:
             headlines.append(diff.hook)
         
         # Generic industry headlines
-        industry_headlines = {
-            "plumber": [
-                "Your Local Plumbing Experts",
-                "Fast. Reliable. Affordable.",
-                "Plumbing Problems? Solved.",
-            ],
-            "electrician": [
-                "Power You Can Trust",
-                "Safe. Reliable. Professional.",
-                "Electrical Done Right",
-            ],
-            "restaurant": [
-                "Taste the Difference",
-                "Where Flavor Meets Freshness",
-                "Your New Favorite Spot",
-            ],
-            "contractor": [
-                "Building Your Vision",
-                "Quality Craftsmanship. Fair Prices.",
-                "Your Home, Transformed",
-            ],
-            "default": [
-                "Service You Can Trust",
-                "Quality. Value. Results.",
-                "The Local Choice",
-            ],
-        }
-        
-        industry_specific = industry_headlines.get(
+        industry_specific = self.INDUSTRY_HEADLINES.get(
             self.business_type,
-            industry_headlines["default"]
+            self.INDUSTRY_HEADLINES["default"]
         )
         headlines.extend(industry_specific)
         
-        return list(set(headlines))[:10]
+        # Order-preserving dedupe: differentiator hooks first, then industry lines
+        return list(dict.fromkeys(headlines))[:10]
     
     def generate_taglines(self, market_analysis: MarketAnalysis) -> List[str]:
         """Generate tagline suggestions."""
-        taglines = [
-            f"Serving {market_analysis.location} with pride",
-            "Quality you can trust, service you deserve",
-            "Your satisfaction, guaranteed",
-            "Locally owned, community trusted",
-            "Excellence in every job",
-            "Where quality meets reliability",
-            "Professional service, personal touch",
-            "Done right. Done on time.",
-        ]
-        
-        return taglines[:8]
+        return [f"Serving {market_analysis.location} with pride", *self.TAGLINES]
     
     def generate_trust_signals_to_use(
         self,
         market_analysis: MarketAnalysis,
     ) -> List[str]:
         """Suggest trust signals to emphasize based on competitor gaps."""
-        # Standard trust signals
-        all_signals = [
-            "Licensed & Insured",
-            "Free Estimates",
-            "Satisfaction Guaranteed",
-            "24/7 Emergency Service",
-            "Same-Day Service Available",
-            "Background-Checked Technicians",
-            "Upfront Pricing",
-            "Locally Owned & Operated",
-            "Family-Owned Since [Year]",
-            "[X]+ Years Experience",
-            "[X]+ 5-Star Reviews",
-            "BBB Accredited",
-        ]
+        common = tuple(market_analysis.common_trust_signals)
+        # Return uncommon first, then common
+        return list(self._rank_uncommon_signals(common)[:6]) + list(common[:4])
+    
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _rank_uncommon_signals(cls, common_trust_signals: tuple) -> tuple:
+        """Standard trust signals not already used by competitors (cached)."""
+        common_lower = [s.lower() for s in common_trust_signals]
+        # One alternation covers "competitor signal inside ours"; one joined
+        # corpus covers "ours inside a competitor signal" (no newlines in ours)
+        common_pattern = (
+            re.compile("|".join(re.escape(c) for c in common_lower))
+            if common_lower else None
+        )
+        common_corpus = "\n".join(common_lower)
         
-        # Prioritize signals NOT commonly used by competitors
         uncommon = []
-        common_lower = [s.lower() for s in market_analysis.common_trust_signals]
-        
-        for signal in all_signals:
+        for signal in cls.STANDARD_TRUST_SIGNALS:
             signal_lower = signal.lower()
-            is_common = any(c in signal_lower or signal_lower in c for c in common_lower)
+            is_common = common_pattern is not None and (
+                common_pattern.search(signal_lower) is not None
+                or signal_lower in common_corpus
+            )
             if not is_common:
                 uncommon.append(signal)
-        
-        # Return uncommon first, then common
-        return uncommon[:6] + market_analysis.common_trust_signals[:4]
+        return tuple(uncommon)
     
-    def _count_offering(self, service: str, websites: List[WebsiteData]) -> int:
-        """Count how many competitors offer a service."""
-        count = 0
-        for website in websites:
-            if any(service.lower() in s.lower() for s in website.services):
-                count += 1
-        return count
+    def _count_offering(self, service: str, service_blobs: List[str]) -> int:
+        """Count how many competitors offer a service.
+        
+        ``service_blobs`` holds one newline-joined, lowercased service list
+        per website (see generate_insights).
+        """
+        service_lower = service.lower()
+        return sum(1 for blob in service_blobs if service_lower in blob)
     
     def _find_missing_trust_signals(self, websites: List[WebsiteData]) -> List[str]:
         """Find trust signals that are rarely used."""
-        desired_signals = [
-            "Background Checked",
-            "Same Day Service",
-            "Upfront Pricing",
-            "Satisfaction Guarantee",
-            "On Time Guarantee",
+        # Signals never contain newlines, so one joined corpus gives the
+        # same matches as checking each competitor signal separately
+        corpus = "\n".join(s.lower() for w in websites for s in w.trust_signals)
+        return [
+            signal for signal in self.DESIRED_TRUST_SIGNALS
+            if signal.lower() not in corpus
         ]
-        
-        all_signals = []
-        for w in websites:
-            all_signals.extend([s.lower() for s in w.trust_signals])
-        
-        missing = []
-        for signal in desired_signals:
-            if not any(signal.lower() in s for s in all_signals):
-                missing.append(signal)
-        
-        return missing
     
     def _check_pricing_opacity(self, websites: List[WebsiteData]) -> bool:
         """Check if most competitors hide pricing."""
@@ -341,36 +394,13 @@ class AdDifferentiationGenerator:
         insights: List[CompetitiveInsight],
     ) -> List[str]:
         """Get supporting points for a hook type."""
-        points_map = {
-            "emergency": ["Fast response time", "Available 24/7", "No extra fees for emergencies"],
-            "trust": ["Licensed and insured", "Background-checked", "Thousands of happy customers"],
-            "pricing": ["Free estimates", "No hidden fees", "Price match guarantee"],
-            "quality": ["Trained professionals", "Premium materials", "Satisfaction guaranteed"],
-            "speed": ["Same-day availability", "On-time guarantee", "Efficient service"],
-            "local": ["Community involvement", "Local knowledge", "Supporting local economy"],
-        }
-        return points_map.get(hook_type, ["Quality service", "Professional team"])
+        # Copy so callers can't mutate the shared table
+        return list(self.SUPPORTING_POINTS.get(hook_type, self.SUPPORTING_POINTS["default"]))
     
     def _get_proof_needed(self, hook_type: str) -> str:
         """Get proof suggestions for a hook type."""
-        proof_map = {
-            "emergency": "Show response time statistics or customer testimonial about emergency service",
-            "trust": "Display review count, ratings, certifications prominently",
-            "pricing": "Show sample pricing or comparison with competitors",
-            "quality": "Before/after photos, warranty information",
-            "speed": "Same-day booking calendar, response time data",
-            "local": "Team photos, community involvement images",
-        }
-        return proof_map.get(hook_type, "Customer testimonials and reviews")
+        return self.PROOF_NEEDED.get(hook_type, "Customer testimonials and reviews")
     
     def _get_best_platform(self, hook_type: str) -> str:
         """Get best platform for a hook type."""
-        platform_map = {
-            "emergency": "Google Ads (search intent)",
-            "trust": "Facebook/Instagram (social proof)",
-            "pricing": "Google Ads, Website",
-            "quality": "Instagram, Website portfolio",
-            "speed": "Google Ads, Google Business Profile",
-            "local": "Facebook, Nextdoor, Local print",
-        }
-        return platform_map.get(hook_type, "All platforms")
+        return self.BEST_PLATFORMS.get(hook_type, "All platforms")
@@ -3,14 +3,26 @@ Local Competitor Intelligence Agent.
 Main orchestrator for the competitive analysis pipeline.
 """
 
+import copy
+import gzip
+import hashlib
 import json
+import threading
 import time
 import os
+import requests
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
+from itertools import chain
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .config import AppConfig
 from .models import (
     SearchInput, Competitor, DiscoveryResult, WebsiteData,
@@ -28,7 +40,7 @@ from .ad_generator import AdDifferentiationGenerator
 
 @dataclass
 class StepTiming:
-    """Timing for a single step."""
+    """Timing for a single step (start/end are perf_counter readings)."""
     step_name: str
     start_time: float = 0.0
     end_time: float = 0.0
@@ -45,13 +57,13 @@ class ProcessLog:
     
     def start_step(self, step_name: str) -> StepTiming:
         """Start timing a step."""
-        step = StepTiming(step_name=step_name, start_time=time.time())
+        step = StepTiming(step_name=step_name, start_time=time.perf_counter())
         self.steps.append(step)
         return step
     
     def end_step(self, step: StepTiming):
         """End timing a step."""
-        step.end_time = time.time()
+        step.end_time = time.perf_counter()
         step.duration_seconds = step.end_time - step.start_time
     
     def finish(self):
@@ -87,15 +99,63 @@ class ProcessLog:
 # Claude Analysis Agent
 # ============================================================================
 
+def _format_competitor_row(c: Competitor) -> str:
+    """One competitor line for the Claude analysis prompt."""
+    return (
+        f"- {c.name}: {c.rating} stars, {c.review_count} reviews, "
+        f"Services: {', '.join(c.services[:5]) if c.services else 'N/A'}, "
+        f"Trust signals: {', '.join(c.trust_signals[:3]) if c.trust_signals else 'N/A'}"
+    )
+
+
 class ClaudeAnalysisAgent:
     """
     Uses Claude to analyze competitor success/failure patterns.
     """
     
+    API_URL = "https://api.anthropic.com/v1/messages"
+    MODEL = "claude-3-haiku-20240307"
+    
+    # Minimum non-empty services/trust-signal lists among prompted competitors
+    MIN_PROMPT_SIGNALS = 3
+    
+    # Parsed analyses keyed by prompt hash; identical prompts skip the API
+    CACHE_SIZE = 512
+    _cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     def __init__(self, api_key: Optional[str] = None):
         """Initialize with Anthropic API key."""
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.available = self.api_key is not None
+        # Keep-alive session so repeated analyses reuse one connection. The
+        # workflow singleton may call this from concurrent chat runs; sharing
+        # is fine since urllib3's pool is thread-safe and no cookies are used
+        self.session = requests.Session()
+    
+    @classmethod
+    def _cache_key(cls, prompt: str) -> str:
+        """Hash the model and rendered prompt into a cache key."""
+        return hashlib.sha256(f"{cls.MODEL}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    @classmethod
+    def _cache_get(cls, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached analysis, or None on a miss."""
+        with cls._cache_lock:
+            cached = cls._cache.get(key)
+            if cached is None:
+                return None
+            cls._cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    @classmethod
+    def _cache_put(cls, key: str, analysis: Dict[str, Any]):
+        """Store a copy of an analysis, evicting the least recently used."""
+        with cls._cache_lock:
+            cls._cache[key] = copy.deepcopy(analysis)
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
     
     def analyze_success_patterns(
         self,
@@ -113,23 +173,41 @@ class ClaudeAnalysisAgent:
                 top_competitors, worst_competitors, market_analysis
             )
         
+        # Without scraped services/trust signals the prompt is mostly "N/A";
+        # skip the API call and use the rule-based analysis instead
+        signal_count = sum(
+            bool(c.services) + bool(c.trust_signals)
+            for c in chain(top_competitors[:5], worst_competitors[:5])
+        )
+        if signal_count < self.MIN_PROMPT_SIGNALS:
+            print(f"  Too little website data for Claude ({signal_count} signals), using rule-based analysis")
+            analysis = self._generate_rule_based_analysis(
+                top_competitors, worst_competitors, market_analysis
+            )
+            analysis["source"] = "rule_based_insufficient_signal"
+            return analysis
+        
         try:
-            import requests
-            
             # Build prompt with competitor data
             prompt = self._build_analysis_prompt(
                 top_competitors, worst_competitors, market_analysis
             )
             
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
+            cache_key = self._cache_key(prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                print("  Using cached Claude analysis")
+                return cached
+            
+            response = self.session.post(
+                self.API_URL,
                 headers={
                     "x-api-key": self.api_key,
                     "content-type": "application/json",
                     "anthropic-version": "2023-06-01",
                 },
                 json={
-                    "model": "claude-3-haiku-20240307",
+                    "model": self.MODEL,
                     "max_tokens": 2000,
                     "messages": [
                         {"role": "user", "content": prompt}
@@ -141,7 +219,11 @@ class ClaudeAnalysisAgent:
             if response.status_code == 200:
                 result = response.json()
                 analysis_text = result["content"][0]["text"]
-                return self._parse_analysis(analysis_text, top_competitors, worst_competitors)
+                analysis = self._parse_analysis(analysis_text, top_competitors, worst_competitors)
+                # Only cache structured results; retry unparseable responses
+                if "raw_analysis" not in analysis:
+                    self._cache_put(cache_key, analysis)
+                return analysis
             else:
                 print(f"  Claude API error: {response.status_code}")
                 return self._generate_rule_based_analysis(
@@ -162,19 +244,8 @@ class ClaudeAnalysisAgent:
     ) -> str:
         """Build the analysis prompt for Claude."""
         
-        top_data = "\n".join([
-            f"- {c.name}: {c.rating} stars, {c.review_count} reviews, "
-            f"Services: {', '.join(c.services[:5]) if c.services else 'N/A'}, "
-            f"Trust signals: {', '.join(c.trust_signals[:3]) if c.trust_signals else 'N/A'}"
-            for c in top_competitors[:5]
-        ])
-        
-        worst_data = "\n".join([
-            f"- {c.name}: {c.rating} stars, {c.review_count} reviews, "
-            f"Services: {', '.join(c.services[:5]) if c.services else 'N/A'}, "
-            f"Trust signals: {', '.join(c.trust_signals[:3]) if c.trust_signals else 'N/A'}"
-            for c in worst_competitors[:5]
-        ])
+        top_data = "\n".join(map(_format_competitor_row, top_competitors[:5]))
+        worst_data = "\n".join(map(_format_competitor_row, worst_competitors[:5]))
         
         return f"""Analyze these local {market_analysis.business_type} businesses in {market_analysis.location}.
 
@@ -205,11 +276,16 @@ Respond ONLY with valid JSON, no other text."""
     ) -> Dict[str, Any]:
         """Parse Claude's analysis response."""
         try:
-            # Try to extract JSON from response
-            import re
-            json_match = re.search(r'\{.*\}', analysis_text, re.DOTALL)
-            if json_match:
-                analysis = json.loads(json_match.group())
+            # Usual case: the response is the JSON object and nothing else
+            blob = analysis_text.strip()
+            if not (blob.startswith("{") and blob.endswith("}")):
+                # Extract the outermost {...} span (first "{" through last "}")
+                start = blob.find("{")
+                end = blob.rfind("}")
+                blob = blob[start:end + 1] if start != -1 and end > start else ""
+            if blob:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                analysis = orjson.loads(blob) if orjson is not None else json.loads(blob)
                 analysis["source"] = "claude"
                 analysis["top_competitors_analyzed"] = [c.name for c in top_competitors[:5]]
                 analysis["worst_competitors_analyzed"] = [c.name for c in worst_competitors[:5]]
@@ -235,18 +311,10 @@ Respond ONLY with valid JSON, no other text."""
         """Generate analysis using rules when Claude is not available."""
         
         # Analyze differences between top and worst
-        top_services = set()
-        top_signals = set()
-        worst_services = set()
-        worst_signals = set()
-        
-        for c in top_competitors:
-            top_services.update(c.services or [])
-            top_signals.update(c.trust_signals or [])
-        
-        for c in worst_competitors:
-            worst_services.update(c.services or [])
-            worst_signals.update(c.trust_signals or [])
+        top_services = set(chain.from_iterable(c.services or () for c in top_competitors))
+        top_signals = set(chain.from_iterable(c.trust_signals or () for c in top_competitors))
+        worst_services = set(chain.from_iterable(c.services or () for c in worst_competitors))
+        worst_signals = set(chain.from_iterable(c.trust_signals or () for c in worst_competitors))
         
         # Services top have that worst don't
         unique_to_top = top_services - worst_services
@@ -307,6 +375,45 @@ Respond ONLY with valid JSON, no other text."""
 # Main Agent Class
 # ============================================================================
 
+def _open_report(filepath: Path, mode: str, compress: bool):
+    """Open a report file for writing, gzip-compressed if requested."""
+    encoding = None if 'b' in mode else 'utf-8'
+    if compress:
+        # Level 3 keeps most of the size win at a fraction of level 9's CPU
+        return gzip.open(filepath, mode, compresslevel=3, encoding=encoding)
+    return open(filepath, mode, encoding=encoding)
+
+
+def _iter_report_json(report_dict: Dict[str, Any]):
+    """
+    Yield a report as indented orjson bytes, one list item at a time.
+    
+    Produces the same bytes as orjson.dumps(report_dict, OPT_INDENT_2), but
+    encodes top-level lists (competitors, website_data with full page text
+    and HTML) per item so the whole report never sits in one buffer.
+    Encoded JSON strings never contain raw newlines, so nesting a dump one
+    level deeper is a plain replace on b"\\n".
+    """
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    if not report_dict:
+        yield b"{}"
+        return
+    
+    yield b"{"
+    for i, (key, value) in enumerate(report_dict.items()):
+        yield b",\n  " if i else b"\n  "
+        yield orjson.dumps(key) + b": "
+        if isinstance(value, list) and value:
+            yield b"["
+            for j, item in enumerate(value):
+                yield b",\n    " if j else b"\n    "
+                yield orjson.dumps(item, option=option).replace(b"\n", b"\n    ")
+            yield b"\n  ]"
+        else:
+            yield orjson.dumps(value, option=option).replace(b"\n", b"\n  ")
+    yield b"\n}"
+
+
 class LocalIntelAgent:
     """
     Local Competitor Intelligence Agent.
@@ -446,33 +553,19 @@ class LocalIntelAgent:
         step2 = process_log.start_step("2. Website Scraping")
         print("\nStep 2: Scraping competitor websites...")
         
-        # Combine top + worst, limiting to max_competitors
-        competitors_to_scrape = []
-        seen_names = set()
-        
-        # Add top competitors first
-        for c in top_competitors:
-            if c.name not in seen_names:
-                competitors_to_scrape.append(c)
-                seen_names.add(c.name)
-        
-        # Add worst competitors
-        for c in worst_competitors:
-            if c.name not in seen_names:
-                competitors_to_scrape.append(c)
-                seen_names.add(c.name)
+        # Combine top + worst (deduped by name, insertion-ordered)
+        competitors_to_scrape: Dict[str, Competitor] = {}
+        for c in chain(top_competitors, worst_competitors):
+            competitors_to_scrape.setdefault(c.name, c)
         
         # If we still have room, add more from the general pool up to max_competitors
-        if len(competitors_to_scrape) < max_competitors:
-            for c in competitors:
-                if c.name not in seen_names:
-                    competitors_to_scrape.append(c)
-                    seen_names.add(c.name)
-                    if len(competitors_to_scrape) >= max_competitors:
-                        break
+        for c in competitors:
+            if len(competitors_to_scrape) >= max_competitors:
+                break
+            competitors_to_scrape.setdefault(c.name, c)
         
         # Update competitors list to only the ones we're analyzing
-        competitors = competitors_to_scrape
+        competitors = list(competitors_to_scrape.values())
         
         websites_with_urls = [c for c in competitors if c.website]
         print(f"  {len(websites_with_urls)} competitors to scrape (of {len(competitors)} selected)")
@@ -495,15 +588,19 @@ class LocalIntelAgent:
         total_signals = sum(len(w.trust_signals) for w in website_data)
         print(f"  Found {total_services} services, {total_signals} trust signals")
         
-        # Update competitors with extracted data
+        # Update competitors with extracted data (first competitor wins on
+        # duplicate names, as the old nested loop's break did)
+        by_name: Dict[str, Competitor] = {}
+        for comp in competitors:
+            by_name.setdefault(comp.name, comp)
         for website in website_data:
-            for comp in competitors:
-                if comp.name == website.competitor_name:
-                    comp.services = website.services
-                    comp.trust_signals = website.trust_signals
-                    comp.taglines = website.taglines
-                    comp.unique_selling_points = website.unique_points
-                    break
+            comp = by_name.get(website.competitor_name)
+            if comp is None:
+                continue
+            comp.services = website.services
+            comp.trust_signals = website.trust_signals
+            comp.taglines = website.taglines
+            comp.unique_selling_points = website.unique_points
         
         process_log.end_step(step3)
         
@@ -602,16 +699,20 @@ class LocalIntelAgent:
         report: IntelligenceReport,
         output_dir: Optional[str] = None,
         prefix: str = "local_intel",
+        compress: bool = False,
     ) -> str:
         """
         Save intelligence report to JSON file.
+        
+        With compress=True the report is written gzip-compressed as
+        ``.json.gz``; website text and HTML typically shrink 5-10x.
         """
         output_dir = output_dir or self.config.output_dir
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{prefix}_{timestamp}.json"
+        filename = f"{prefix}_{timestamp}.json.gz" if compress else f"{prefix}_{timestamp}.json"
         filepath = output_path / filename
         
         # Build extended report
@@ -650,8 +751,14 @@ class LocalIntelAgent:
                 for w in report._website_data
             ]
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson emits UTF-8 bytes directly (never ASCII-escapes)
+            with _open_report(filepath, 'wb', compress) as f:
+                f.writelines(_iter_report_json(report_dict))
+        else:
+            # json.dump already writes iterencode() chunks as it goes
+            with _open_report(filepath, 'wt', compress) as f:
+                json.dump(report_dict, f, indent=2, ensure_ascii=False)
         
         print(f"\nReport saved to: {filepath}")
         return str(filepath)
@@ -736,6 +843,7 @@ def run_analysis(
     worst_radius_multiplier: float = 3.0,
     top_count: int = 3,
     worst_count: int = 3,
+    compress: bool = False,
 ) -> IntelligenceReport:
     """
     Convenience function to run competitive analysis.
@@ -745,6 +853,7 @@ def run_analysis(
         worst_radius_multiplier: How much larger to search for worst-rated (e.g., 3.0 = 3x radius)
         top_count: Number of top-rated competitors to analyze
         worst_count: Number of worst-rated competitors to analyze
+        compress: If True, save the report gzip-compressed (.json.gz)
     """
     agent = LocalIntelAgent()
     
@@ -759,7 +868,7 @@ def run_analysis(
     )
     
     if save:
-        agent.save_report(report, output_dir)
+        agent.save_report(report, output_dir, compress=compress)
     
     agent.print_summary(report)
     
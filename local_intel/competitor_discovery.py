@@ -32,6 +32,8 @@ class CompetitorDiscovery:
     def __init__(self, config: AppConfig):
         self.config = config
         self.request_delay = config.request_delay
+        # Keep-alive session so paginated searches reuse one connection
+        self.session = requests.Session()
     
     def discover(self, search: SearchInput) -> DiscoveryResult:
         """
@@ -213,7 +215,7 @@ class CompetitorDiscovery:
             params["ll"] = f"@{lat.strip()},{lng.strip()},14z"
             params["q"] = search.business_type
         
-        response = requests.get(
+        response = self.session.get(
             "https://serpapi.com/search",
             params=params,
             timeout=30,
@@ -265,7 +267,7 @@ class CompetitorDiscovery:
             "region": "us",
         }
         
-        response = requests.get(
+        response = self.session.get(
             "https://api.outscraper.com/maps/search-v3",
             headers=headers,
             params=params,
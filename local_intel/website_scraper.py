@@ -32,6 +32,8 @@ class WebsiteScraper:
     def __init__(self, config: AppConfig):
         self.config = config
         self.request_delay = config.request_delay
+        # Keep-alive session so pages on the same host reuse one connection
+        self.session = requests.Session()
     
     def scrape_competitor(self, competitor: Competitor) -> Optional[WebsiteData]:
         """
@@ -147,7 +149,7 @@ class WebsiteScraper:
             return None
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 "https://api.firecrawl.dev/v1/scrape",
                 headers={
                     "Authorization": f"Bearer {self.config.firecrawl.api_key}",
@@ -201,7 +203,7 @@ class WebsiteScraper:
         try:
             jina_url = f"https://r.jina.ai/{url}"
             
-            response = requests.get(
+            response = self.session.get(
                 jina_url,
                 headers={
                     "Accept": "text/plain",
@@ -252,7 +254,7 @@ class WebsiteScraper:
     def _fetch_raw_html(self, url: str) -> Optional[str]:
         """Fetch raw HTML of a URL (no Firecrawl/Jina). One simple GET."""
         try:
-            r = requests.get(
+            r = self.session.get(
                 url,
                 headers={"User-Agent": "LocalIntelAgent/1.0"},
                 timeout=15,
@@ -60,6 +60,12 @@ _workflow: Optional[MarkyWorkflow] = None
 # Track processed messages to prevent duplicates
 _processed_messages: set = set()
 
+# Workflow stage messages forwarded to the chat sender
+_PROGRESS_PREFIXES = ("🔍", "🗣️", "📈", "📦", "📋")
+
+# "X in Y" request pattern (business, location), compiled once at import
+_IN_PATTERN = re.compile(r"(.+?)\s+(?:in|near|around)\s+(.+)", re.IGNORECASE)
+
 
 # =============================================================================
 # Helper Functions
@@ -104,8 +110,7 @@ def parse_research_request(user_text: str) -> Optional[AdResearchRequest]:
             text = text[len(prefix):].strip()
     
     # Try to parse "X in Y" pattern
-    in_pattern = r"(.+?)\s+(?:in|near|around)\s+(.+)"
-    match = re.match(in_pattern, text, re.IGNORECASE)
+    match = _IN_PATTERN.match(text)
     
     if match:
         business_type = match.group(1).strip()
@@ -271,15 +276,33 @@ async def handle_chat_message(ctx: Context, sender: str, msg: ChatMessage):
                     
                     # Progress callback to send updates
                     async def send_progress(msg: str):
-                        if msg.startswith("🔍") or msg.startswith("🗣️") or msg.startswith("📈") or msg.startswith("📦") or msg.startswith("📋"):
+                        if msg.startswith(_PROGRESS_PREFIXES):
                             await ctx.send(sender, create_chat_message(msg))
                     
                     # Run in thread pool to avoid blocking
                     loop = asyncio.get_event_loop()
+                    
+                    progress_futures = []
+                    
+                    def on_progress(msg: str):
+                        # Called from the worker thread; schedule the send on the event loop
+                        progress_futures.append(
+                            asyncio.run_coroutine_threadsafe(send_progress(msg), loop)
+                        )
+                    
                     response = await loop.run_in_executor(
                         None,
-                        lambda: workflow.run(request),
+                        lambda: workflow.run(request, progress_callback=on_progress),
+                    )
+                    
+                    # Let in-flight progress sends finish so the report arrives last
+                    progress_results = await asyncio.gather(
+                        *map(asyncio.wrap_future, progress_futures),
+                        return_exceptions=True,
                     )
+                    for err in progress_results:
+                        if isinstance(err, Exception):
+                            ctx.logger.warning(f"⚠️ Progress update failed: {err}")
                     
                     # Send result
                     result_markdown = response.to_markdown()
@@ -1,12 +1,14 @@
 """
-Marky Workflow - Sequential agent orchestration.
+Marky Workflow - Agent orchestration.
 
-Runs the intelligence agents in sequence and synthesizes results.
+Runs the intelligence agents (independent ones concurrently) and
+synthesizes results.
 """
 
 import os
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from dataclasses import asdict
 
@@ -37,7 +39,11 @@ from related_questions_intel.agent import RelatedQuestionsIntelAgent
 
 class MarkyWorkflow:
     """
-    Sequential workflow that orchestrates all intelligence agents.
+    Workflow that orchestrates all intelligence agents.
+    
+    Yelp, Trends and Related Questions run in background threads while
+    Local Intel and Review Intel run in order; results are merged in
+    stage order below.
     
     Pipeline (raw data collection, no filtering):
     1. Local Intel - Find competitors, scrape websites
@@ -49,12 +55,47 @@ class MarkyWorkflow:
     """
 
     def __init__(self):
-        """Initialize the workflow with agent instances."""
-        self.local_intel = LocalIntelAgent()
-        self.review_intel = ReviewIntelAgent()
-        self.yelp_intel = YelpIntelAgent()
-        self.trends_intel = TrendsIntelAgent()
-        self.related_questions_intel = RelatedQuestionsIntelAgent()
+        """Initialize the workflow. Agents are created on first use."""
+        self._local_intel: Optional[LocalIntelAgent] = None
+        self._review_intel: Optional[ReviewIntelAgent] = None
+        self._yelp_intel: Optional[YelpIntelAgent] = None
+        self._trends_intel: Optional[TrendsIntelAgent] = None
+        self._related_questions_intel: Optional[RelatedQuestionsIntelAgent] = None
+    
+    @property
+    def local_intel(self) -> LocalIntelAgent:
+        """Get or create the Local Intel agent."""
+        if self._local_intel is None:
+            self._local_intel = LocalIntelAgent()
+        return self._local_intel
+    
+    @property
+    def review_intel(self) -> ReviewIntelAgent:
+        """Get or create the Review Intel agent."""
+        if self._review_intel is None:
+            self._review_intel = ReviewIntelAgent()
+        return self._review_intel
+    
+    @property
+    def yelp_intel(self) -> YelpIntelAgent:
+        """Get or create the Yelp Intel agent."""
+        if self._yelp_intel is None:
+            self._yelp_intel = YelpIntelAgent()
+        return self._yelp_intel
+    
+    @property
+    def trends_intel(self) -> TrendsIntelAgent:
+        """Get or create the Trends Intel agent."""
+        if self._trends_intel is None:
+            self._trends_intel = TrendsIntelAgent()
+        return self._trends_intel
+    
+    @property
+    def related_questions_intel(self) -> RelatedQuestionsIntelAgent:
+        """Get or create the Related Questions Intel agent."""
+        if self._related_questions_intel is None:
+            self._related_questions_intel = RelatedQuestionsIntelAgent()
+        return self._related_questions_intel
         
     def run(
         self,
@@ -81,7 +122,51 @@ class MarkyWorkflow:
         def log(msg: str):
             print(msg)
             if progress_callback:
-                progress_callback(msg)
+                # A failing callback must not abort the stage it reports on;
+                # catch Exception only so cancellation/interrupts still propagate
+                try:
+                    progress_callback(msg)
+                except Exception as e:
+                    print(f"  ⚠ Progress callback error: {e}")
+        
+        # Yelp, Trends and Related Questions don't depend on Local Intel,
+        # so start them now and collect each result at its own stage.
+        # Agents are resolved inside the worker so construction errors
+        # (e.g. missing API keys) surface in that stage's error handling.
+        keywords = [
+            request.business_type,
+            f"{request.business_type} near me",
+            f"best {request.business_type}",
+        ]
+        executor = ThreadPoolExecutor(max_workers=3)
+        yelp_future = executor.submit(
+            lambda: self.yelp_intel.analyze_market(
+                business_type=request.business_type,
+                location=request.location,
+                max_businesses=min(5, request.max_competitors),
+                reviews_per_business=request.reviews_per_competitor,
+            )
+        )
+        trends_future = None
+        if request.include_trends:
+            trends_future = executor.submit(
+                lambda: self.trends_intel.analyze(
+                    keywords=keywords,
+                    location="United States",
+                    include_related=True,
+                )
+            )
+        rq_future = executor.submit(
+            lambda: self.related_questions_intel.analyze(
+                business_type=request.business_type,
+                location=request.location,
+                seed_queries=None,
+                max_questions_per_query=15,
+            )
+        )
+        
+        background = ["Yelp", "Trends", "Related Questions"] if trends_future else ["Yelp", "Related Questions"]
+        log(f"  ↻ Started {', '.join(background)} in the background")
         
         try:
             # ================================================================
@@ -200,15 +285,10 @@ class MarkyWorkflow:
             # ================================================================
             # Stage 3: Yelp Intelligence
             # ================================================================
-            log("🗣️ Stage 3/6: Running Yelp Intelligence...")
+            log("🗣️ Stage 3/6: Collecting Yelp Intelligence results...")
             
             try:
-                yelp_analysis = self.yelp_intel.analyze_market(
-                    business_type=request.business_type,
-                    location=request.location,
-                    max_businesses=min(5, request.max_competitors),
-                    reviews_per_business=request.reviews_per_competitor,
-                )
+                yelp_analysis = yelp_future.result()
                 
                 result.agents_used.append("yelp_intel")
                 
@@ -246,22 +326,11 @@ class MarkyWorkflow:
             # ================================================================
             # Stage 4: Trends Intelligence
             # ================================================================
-            if request.include_trends:
-                log("📈 Stage 4/6: Running Trends Intelligence...")
+            if trends_future is not None:
+                log("📈 Stage 4/6: Collecting Trends Intelligence results...")
                 
                 try:
-                    # Build keywords from business type
-                    keywords = [
-                        request.business_type,
-                        f"{request.business_type} near me",
-                        f"best {request.business_type}",
-                    ]
-                    
-                    trends_analysis = self.trends_intel.analyze(
-                        keywords=keywords,
-                        location="United States",
-                        include_related=True,
-                    )
+                    trends_analysis = trends_future.result()
                     
                     result.agents_used.append("trends_intel")
                     
@@ -305,14 +374,9 @@ class MarkyWorkflow:
             # ================================================================
             # Stage 5: Related Questions Intelligence
             # ================================================================
-            log("❓ Stage 5/6: Running Related Questions Intelligence...")
+            log("❓ Stage 5/6: Collecting Related Questions Intelligence results...")
             try:
-                rq_analysis = self.related_questions_intel.analyze(
-                    business_type=request.business_type,
-                    location=request.location,
-                    seed_queries=None,
-                    max_questions_per_query=15,
-                )
+                rq_analysis = rq_future.result()
                 result.agents_used.append("related_questions_intel")
                 result.related_questions = rq_analysis.all_questions()
                 log(f"  ✓ Collected {len(result.related_questions)} related questions")
@@ -343,6 +407,8 @@ class MarkyWorkflow:
                 result=result,
                 error=str(e),
             )
+        finally:
+            executor.shutdown(wait=False)
     
 def run_workflow(
     business_type: str,
@@ -23,6 +23,8 @@ class RelatedQuestionsScraper:
         if not self.api_key:
             raise ValueError("SERPAPI_KEY not set. Get one at https://serpapi.com")
         self.base_url = "https://serpapi.com/search"
+        # Keep-alive session so repeated SerpAPI calls reuse one connection
+        self.session = requests.Session()
 
     def get_related_questions(
         self,
@@ -58,7 +60,7 @@ class RelatedQuestionsScraper:
             if location:
                 params["location"] = location
 
-            response = requests.get(
+            response = self.session.get(
                 self.base_url, params=params, timeout=REQUEST_TIMEOUT
             )
             response.raise_for_status()
@@ -18,6 +18,8 @@ class GoogleReviewsScraper:
             raise ValueError("SERPAPI_KEY not set. Get one at https://serpapi.com")
         
         self.base_url = "https://serpapi.com/search"
+        # Keep-alive session so repeated SerpAPI calls reuse one connection
+        self.session = requests.Session()
     
     def get_reviews(
         self,
@@ -51,7 +53,7 @@ class GoogleReviewsScraper:
                 "sort_by": sort_by,
             }
             
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -94,7 +96,7 @@ class GoogleReviewsScraper:
                 params["data_id"] = place_id
                 del params["place_id"]
                 
-                response = requests.get(self.base_url, params=params, timeout=30)
+                response = self.session.get(self.base_url, params=params, timeout=30)
                 if response.ok:
                     data = response.json()
                     for review_data in data.get("reviews", [])[:max_reviews]:
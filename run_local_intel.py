@@ -87,6 +87,12 @@ API Keys (set as environment variables):
         help="Don't save output files",
     )
     
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Save the report gzip-compressed (.json.gz)",
+    )
+    
     parser.add_argument(
         "--interactive", "-i",
         action="store_true",
@@ -253,6 +259,7 @@ def main():
             worst_radius_multiplier=args.worst_radius,
             top_count=args.top_count,
             worst_count=args.worst_count,
+            compress=args.gzip,
         )
         
         # Output as JSON if requested
@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import gzip
 import json
 import sys
 import os
@@ -88,12 +89,13 @@ def parse_args():
 
 
 def find_latest_local_intel(output_dir: str = "output") -> str:
-    """Find the most recent local_intel JSON file."""
+    """Find the most recent local_intel JSON file (plain or gzip-compressed)."""
     output_path = Path(output_dir)
     if not output_path.exists():
         return None
     
     files = list(output_path.glob("local_intel_*.json"))
+    files += output_path.glob("local_intel_*.json.gz")
     if not files:
         return None
     
@@ -103,8 +105,9 @@ def find_latest_local_intel(output_dir: str = "output") -> str:
 
 
 def load_competitors_from_local_intel(filepath: str) -> tuple:
-    """Load competitors from local_intel output."""
-    with open(filepath, "r", encoding="utf-8") as f:
+    """Load competitors from local_intel output (.json or .json.gz)."""
+    opener = gzip.open if filepath.endswith(".gz") else open
+    with opener(filepath, "rt", encoding="utf-8") as f:
         data = json.load(f)
     
     search = data.get("search", {}) or data.get("search_input", {})
@@ -58,6 +58,8 @@ class DataForSEOClient:
             "Authorization": f"Basic {encoded}",
             "Content-Type": "application/json",
         }
+        # Keep-alive session so repeated DataForSEO calls reuse one connection
+        self.session = requests.Session()
     
     def get_search_volume(
         self,
@@ -92,7 +94,7 @@ class DataForSEOClient:
                 "language_code": language,
             }]
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.BASE_URL}/keywords_data/google_ads/search_volume/live",
                 headers=self.headers,
                 json=payload,
@@ -164,7 +166,7 @@ class DataForSEOClient:
                 "item_types": ["google_trends_graph", "google_trends_queries_list"],
             }]
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.BASE_URL}/keywords_data/google_trends/explore/live",
                 headers=self.headers,
                 json=payload,
@@ -228,7 +230,7 @@ class DataForSEOClient:
                 "item_types": ["google_trends_queries_list"],
             }]
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.BASE_URL}/keywords_data/google_trends/explore/live",
                 headers=self.headers,
                 json=payload,
@@ -31,6 +31,8 @@ class YelpScraper:
             raise ValueError("SERPAPI_KEY not set. Get one at https://serpapi.com")
         
         self.base_url = "https://serpapi.com/search"
+        # Keep-alive session so repeated SerpAPI calls reuse one connection
+        self.session = requests.Session()
     
     @retry(
         stop=stop_after_attempt(MAX_RETRIES),
@@ -40,7 +42,7 @@ class YelpScraper:
     )
     def _request_with_retry(self, params: dict) -> dict:
         """Make SerpAPI request with retries on timeout/connection errors."""
-        response = requests.get(
+        response = self.session.get(
             self.base_url, params=params, timeout=REQUEST_TIMEOUT
         )
         response.raise_for_status()